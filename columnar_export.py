@@ -0,0 +1,266 @@
+import argparse
+import hashlib
+import json
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+###################################################
+# Table Schemas
+###################################################
+PAPERS_SCHEMA = pa.schema([
+    ("paper_id", pa.int64()),
+    ("paper_key", pa.string()),
+    ("parent_id", pa.int64()),
+    ("depth", pa.int32()),
+    ("title", pa.string()),
+    ("link", pa.string()),
+    ("cited_by_link", pa.string()),
+    ("num_citations", pa.int64()),
+    ("versions_link", pa.string()),
+    ("fetched_at", pa.timestamp("ms", tz="UTC")),
+])
+
+# One row per citation: the citing paper (a child in the tree) cites its parent.
+EDGES_SCHEMA = pa.schema([
+    ("citing_id", pa.int64()),
+    ("cited_id", pa.int64()),
+    ("citing_key", pa.string()),
+    ("cited_key", pa.string()),
+    ("citing_link", pa.string()),
+    ("cited_link", pa.string()),
+])
+
+FORMATS = ("parquet", "arrow")
+DEFAULT_BATCH_SIZE = 65536
+
+###################################################
+# Row Helpers
+###################################################
+def paper_key(paper):
+    """
+    Stable key for a paper: a hash of its link and title. Unlike paper_id it
+    is the same across exports and for a paper reached through two branches.
+    """
+    text = f"{paper.get('link') or ''}\n{paper.get('title') or ''}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def _as_int(value):
+    """Leniently cast a scraped count to int, returning None if it isn't one."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+def _same_paper(a, b):
+    return a.get("title") == b.get("title") and a.get("link") == b.get("link")
+
+def is_node_path(paper_list):
+    """
+    True if paper_list is a path written by 'Save Node Path to File', i.e.
+    every entry after the first is one of the children of the entry before it.
+    """
+    if len(paper_list) < 2:
+        return False
+    for parent, child in zip(paper_list, paper_list[1:]):
+        if not any(_same_paper(c, child) for c in parent.get("children", [])):
+            return False
+    return True
+
+def node_path_to_tree(paper_list):
+    """
+    Turn a saved node path [root, ..., node] into a single-root tree: each
+    entry keeps only the next path entry as its child, and the selected node
+    keeps its own children.
+    """
+    node = paper_list[-1]
+    for paper in reversed(paper_list[:-1]):
+        node = dict(paper, children=[node])
+    return [node]
+
+###################################################
+# Tree Walking
+###################################################
+def iter_paper_rows(paper_list):
+    """
+    Walk a list of root papers (nested "children" dicts, as written by
+    save_tree_state) depth-first and yield (paper_row, edge_row) pairs.
+    edge_row is None for root papers. "Load Next Page" placeholders are
+    skipped. paper_id is the walk order and is only valid within one
+    export; use paper_key to join across exports or branches.
+    """
+    next_id = 0
+    stack = [(paper, None, 0) for paper in reversed(paper_list)]
+    while stack:
+        paper, parent, depth = stack.pop()
+        if paper.get("is_next_page"):
+            continue
+
+        paper_id = next_id
+        next_id += 1
+
+        fetched_at = paper.get("fetched_at")
+        paper_row = {
+            "paper_id": paper_id,
+            "paper_key": paper_key(paper),
+            "parent_id": parent["paper_id"] if parent else None,
+            "depth": depth,
+            "title": paper.get("title", ""),
+            "link": paper.get("link") or None,
+            "cited_by_link": paper.get("cited_by_link"),
+            "num_citations": _as_int(paper.get("num_citations")),
+            "versions_link": paper.get("versions_link"),
+            "fetched_at": int(fetched_at * 1000) if fetched_at is not None else None,
+        }
+
+        edge_row = None
+        if parent:
+            edge_row = {
+                "citing_id": paper_id,
+                "cited_id": parent["paper_id"],
+                "citing_key": paper_row["paper_key"],
+                "cited_key": parent["paper_key"],
+                "citing_link": paper_row["link"],
+                "cited_link": parent["link"],
+            }
+
+        yield paper_row, edge_row
+
+        for child in reversed(paper.get("children", [])):
+            stack.append((child, paper_row, depth + 1))
+
+###################################################
+# Batched Writers
+###################################################
+class _BatchWriter:
+    """Buffers rows and flushes them to a Parquet or Arrow IPC file as record batches."""
+
+    def __init__(self, path, schema, fmt, batch_size):
+        self.schema = schema
+        self.batch_size = batch_size
+        self.rows = []
+        if fmt == "parquet":
+            self.writer = pq.ParquetWriter(path, schema)
+        else:
+            self.writer = pa.ipc.new_file(path, schema)
+
+    def append(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        batch = pa.RecordBatch.from_pylist(self.rows, schema=self.schema)
+        self.writer.write_batch(batch)
+        self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+def export_paths(prefix, fmt="parquet"):
+    """Return the (papers_path, edges_path) pair written for a given output prefix."""
+    return f"{prefix}.papers.{fmt}", f"{prefix}.edges.{fmt}"
+
+def export_tree(paper_list, prefix, fmt="parquet", batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Export a citation tree as two columnar tables, <prefix>.papers.<fmt> and
+    <prefix>.edges.<fmt>. Rows are written in record batches of batch_size
+    as the tree is walked, so only one batch per table is held in memory.
+    For Parquet each batch becomes one row group, so batch_size also sets
+    the row-group size. A saved node path is exported as a single chain.
+    Returns (num_papers, num_edges). If the export fails, the files this
+    call created are removed before the error is re-raised.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}', expected one of {FORMATS}.")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+
+    if is_node_path(paper_list):
+        paper_list = node_path_to_tree(paper_list)
+
+    papers_path, edges_path = export_paths(prefix, fmt)
+    writers = []
+    created_paths = []
+    num_papers = 0
+    num_edges = 0
+    try:
+        papers_writer = _BatchWriter(papers_path, PAPERS_SCHEMA, fmt, batch_size)
+        writers.append(papers_writer)
+        created_paths.append(papers_path)
+        edges_writer = _BatchWriter(edges_path, EDGES_SCHEMA, fmt, batch_size)
+        writers.append(edges_writer)
+        created_paths.append(edges_path)
+
+        for paper_row, edge_row in iter_paper_rows(paper_list):
+            papers_writer.append(paper_row)
+            num_papers += 1
+            if edge_row:
+                edges_writer.append(edge_row)
+                num_edges += 1
+
+        while writers:
+            writers.pop(0).close()
+    except Exception:
+        for writer in writers:
+            try:
+                writer.writer.close()
+            except Exception:
+                pass
+        for path in created_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+
+    return num_papers, num_edges
+
+def export_json_file(json_path, prefix, fmt="parquet", batch_size=DEFAULT_BATCH_SIZE):
+    """Export a tree saved with 'Save Tree' (or a saved node path) to columnar tables."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        paper_list = json.load(f)
+    return export_tree(paper_list, prefix, fmt=fmt, batch_size=batch_size)
+
+###################################################
+# Command Line
+###################################################
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export a saved citation tree JSON file to Parquet/Arrow tables."
+    )
+    parser.add_argument("json_path", help="Tree state JSON file to export.")
+    parser.add_argument(
+        "prefix", nargs="?",
+        help="Output prefix (default: JSON path without its extension)."
+    )
+    parser.add_argument("--format", choices=FORMATS, default="parquet", dest="fmt")
+    parser.add_argument("--batch-size", type=_positive_int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    prefix = args.prefix
+    if not prefix:
+        prefix = args.json_path[:-5] if args.json_path.endswith(".json") else args.json_path
+
+    num_papers, num_edges = export_json_file(
+        args.json_path, prefix, fmt=args.fmt, batch_size=args.batch_size
+    )
+    papers_path, edges_path = export_paths(prefix, args.fmt)
+    print(f"Wrote {num_papers} papers to {papers_path}")
+    print(f"Wrote {num_edges} citation edges to {edges_path}")
+
+if __name__ == "__main__":
+    main()
@@ -58,6 +58,7 @@ def search_google_scholar(query, driver, max_results=10, page_url=None):
         driver.get(url)
 
     time.sleep(1.5)
+    fetched_at = time.time()
 
     results = []
     entries = driver.find_elements(By.CSS_SELECTOR, ".gs_r .gs_ri")
@@ -97,7 +98,8 @@ def search_google_scholar(query, driver, max_results=10, page_url=None):
             "is_next_page": False,
             "next_page_url": None,
             "children": [],
-            "versions_link": versions_link  # NEW
+            "versions_link": versions_link,  # NEW
+            "fetched_at": fetched_at
         })
 
     # Next page
@@ -128,6 +130,7 @@ def get_citing_papers(cited_by_url, driver, max_results=10, page_url=None):
 
     driver.get(page_url if page_url else cited_by_url)
     time.sleep(1.5)
+    fetched_at = time.time()
 
     results = []
     entries = driver.find_elements(By.CSS_SELECTOR, ".gs_r .gs_ri")
@@ -159,7 +162,8 @@ def get_citing_papers(cited_by_url, driver, max_results=10, page_url=None):
             "is_next_page": False,
             "next_page_url": None,
             "children": [],
-            "versions_link": None  # ignoring versions in citing papers for brevity
+            "versions_link": None,  # ignoring versions in citing papers for brevity
+            "fetched_at": fetched_at
         })
 
     next_page_url = None
@@ -247,6 +251,9 @@ class CitationExplorer(tk.Tk):
         save_button = ttk.Button(control_frame, text="Save Tree", command=self.save_tree_state)
         save_button.pack(side=tk.LEFT, padx=5)
 
+        export_button = ttk.Button(control_frame, text="Export Parquet", command=self.export_tree_columnar)
+        export_button.pack(side=tk.LEFT, padx=5)
+
         load_button = ttk.Button(control_frame, text="Load Path", command=self.load_saved_path)
         load_button.pack(side=tk.LEFT, padx=5)
 
@@ -280,6 +287,7 @@ class CitationExplorer(tk.Tk):
 
         self.tree_menu.add_command(label="Save Node Path to File", command=self.save_node_path_to_file)
         self.tree_menu.add_command(label="Save Tree State", command=self.save_tree_state)
+        self.tree_menu.add_command(label="Export Tree to Parquet", command=self.export_tree_columnar)
 
     # NEW: Show All Versions handler
     def on_show_all_versions(self):
@@ -562,10 +570,12 @@ class CitationExplorer(tk.Tk):
                 "title": paper.get("title", ""),
                 "link": paper.get("link", ""),
                 "cited_by_link": paper.get("cited_by_link"),
+                "num_citations": paper.get("num_citations"),
                 "is_next_page": paper.get("is_next_page", False),
                 "next_page_url": paper.get("next_page_url"),
                 "children": paper.get("children", []),
-                "versions_link": paper.get("versions_link")  # Include versions link if you'd like
+                "versions_link": paper.get("versions_link"),  # Include versions link if you'd like
+                "fetched_at": paper.get("fetched_at")
             })
             current_id = self.tree.parent(current_id)
         path.reverse()
@@ -613,6 +623,41 @@ class CitationExplorer(tk.Tk):
         except Exception as e:
             self.set_status(f"Error saving tree: {e}")
 
+    def export_tree_columnar(self):
+        """
+        Export the current tree as papers/edges Parquet tables. The in-memory
+        paper dicts are walked directly and written in record batches, so no
+        nested copy of the tree is built first.
+        """
+        try:
+            from columnar_export import export_paths, export_tree
+        except ImportError as e:
+            self.set_status(f"Columnar export requires pyarrow: {e}")
+            return
+
+        root_nodes = self.tree.get_children("")
+        paper_list = [self.item_to_paper[rn] for rn in root_nodes if rn in self.item_to_paper]
+        if not paper_list:
+            self.set_status("Nothing to export.")
+            return
+
+        file_path = asksaveasfilename(
+            title="Export Tree to Parquet",
+            defaultextension=".parquet",
+            filetypes=[("Parquet Files", "*.parquet"), ("All Files", "*.*")]
+        )
+        if not file_path:
+            self.set_status("Export operation canceled.")
+            return
+
+        prefix = file_path[:-len(".parquet")] if file_path.endswith(".parquet") else file_path
+        try:
+            num_papers, num_edges = export_tree(paper_list, prefix)
+            papers_path, edges_path = export_paths(prefix)
+            self.set_status(f"Exported {num_papers} papers to {papers_path} and {num_edges} edges to {edges_path}")
+        except Exception as e:
+            self.set_status(f"Error exporting tree: {e}")
+
     def build_paper_recursive(self, item_id):
         paper = self.item_to_paper.get(item_id)
         if not paper:
@@ -622,10 +667,12 @@ class CitationExplorer(tk.Tk):
             "title": paper.get("title", ""),
             "link": paper.get("link", ""),
             "cited_by_link": paper.get("cited_by_link"),
+            "num_citations": paper.get("num_citations"),
             "is_next_page": paper.get("is_next_page", False),
             "next_page_url": paper.get("next_page_url"),
             "children": [],
-            "versions_link": paper.get("versions_link")  # Keep versions_link
+            "versions_link": paper.get("versions_link"),  # Keep versions_link
+            "fetched_at": paper.get("fetched_at")
         }
 
         for child_id in self.tree.get_children(item_id):
@@ -0,0 +1,152 @@
+import json
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+import columnar_export
+from columnar_export import export_json_file, export_paths, export_tree, iter_paper_rows
+
+
+def make_paper(title, children=None, **extra):
+    paper = {
+        "title": title,
+        "link": f"https://example.org/{title}",
+        "cited_by_link": None,
+        "num_citations": 1,
+        "is_next_page": False,
+        "next_page_url": None,
+        "children": children or [],
+        "versions_link": None,
+    }
+    paper.update(extra)
+    return paper
+
+
+def next_page():
+    return {
+        "title": "Load Next Page >>",
+        "link": "",
+        "cited_by_link": None,
+        "num_citations": None,
+        "is_next_page": True,
+        "next_page_url": "https://example.org/next",
+        "children": [],
+        "versions_link": None,
+    }
+
+
+def sample_tree():
+    c = make_paper("C")
+    b = make_paper("B", [c])
+    d = make_paper("D")
+    return [make_paper("R", [b, next_page(), d], fetched_at=1.5)]
+
+
+def test_iter_paper_rows_skips_next_page_and_sets_parent_and_depth():
+    rows = list(iter_paper_rows(sample_tree()))
+    papers = [(p["title"], p["parent_id"], p["depth"]) for p, _ in rows]
+    assert papers == [("R", None, 0), ("B", 0, 1), ("C", 1, 2), ("D", 0, 1)]
+    assert rows[0][0]["fetched_at"] == 1500
+
+
+def test_edges_point_from_citing_to_cited():
+    rows = list(iter_paper_rows(sample_tree()))
+    assert rows[0][1] is None
+    papers = {p["paper_id"]: p for p, _ in rows}
+    for paper_row, edge_row in rows[1:]:
+        assert edge_row["citing_id"] == paper_row["paper_id"]
+        assert edge_row["cited_id"] == paper_row["parent_id"]
+        assert edge_row["cited_key"] == papers[paper_row["parent_id"]]["paper_key"]
+
+
+def test_paper_key_is_stable_across_branches():
+    shared = make_paper("S")
+    tree = [make_paper("R", [make_paper("A", [dict(shared)]), make_paper("B", [dict(shared)])])]
+    keys = [p["paper_key"] for p, _ in iter_paper_rows(tree) if p["title"] == "S"]
+    assert len(keys) == 2 and keys[0] == keys[1]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_export_tree_writes_both_tables(tmp_path, fmt):
+    prefix = str(tmp_path / "tree")
+    assert export_tree(sample_tree(), prefix, fmt=fmt, batch_size=2) == (4, 3)
+
+    papers_path, edges_path = export_paths(prefix, fmt)
+    if fmt == "parquet":
+        papers = pq.read_table(papers_path)
+        edges = pq.read_table(edges_path)
+    else:
+        papers = pa.ipc.open_file(papers_path).read_all()
+        edges = pa.ipc.open_file(edges_path).read_all()
+
+    assert papers.schema.equals(columnar_export.PAPERS_SCHEMA)
+    assert papers.column("title").to_pylist() == ["R", "B", "C", "D"]
+    assert edges.column("cited_id").to_pylist() == [0, 1, 0]
+
+
+def node_path():
+    c = make_paper("C", [make_paper("E")])
+    b = make_paper("B", [c])
+    r = make_paper("R", [b, make_paper("D")])
+    return [r, b, c]
+
+
+def test_export_tree_handles_node_path(tmp_path):
+    prefix = str(tmp_path / "path")
+    assert export_tree(node_path(), prefix) == (4, 3)
+
+    papers = pq.read_table(export_paths(prefix)[0]).to_pylist()
+    assert [(p["title"], p["parent_id"], p["depth"]) for p in papers] == [
+        ("R", None, 0), ("B", 0, 1), ("C", 1, 2), ("E", 2, 3)
+    ]
+
+
+def test_export_json_file_handles_node_path(tmp_path):
+    json_path = tmp_path / "path.json"
+    json_path.write_text(json.dumps(node_path()), encoding="utf-8")
+
+    prefix = str(tmp_path / "path")
+    assert export_json_file(str(json_path), prefix) == (4, 3)
+
+    papers = pq.read_table(export_paths(prefix)[0]).to_pylist()
+    assert [(p["title"], p["parent_id"], p["depth"]) for p in papers] == [
+        ("R", None, 0), ("B", 0, 1), ("C", 1, 2), ("E", 2, 3)
+    ]
+
+
+def test_non_integer_citation_count_is_exported_as_null(tmp_path):
+    prefix = str(tmp_path / "tree")
+    export_tree([make_paper("R", num_citations="N/A")], prefix)
+    papers = pq.read_table(export_paths(prefix)[0])
+    assert papers.column("num_citations").to_pylist() == [None]
+
+
+def test_failed_export_removes_partial_files(tmp_path):
+    prefix = str(tmp_path / "bad")
+    tree = [make_paper("R", [make_paper("B", fetched_at="yesterday")])]
+    # "yesterday" * 1000 is a string, which int() rejects.
+    with pytest.raises(ValueError):
+        export_tree(tree, prefix, batch_size=1)
+    for path in export_paths(prefix):
+        assert not os.path.exists(path)
+
+
+def test_failed_open_keeps_files_from_earlier_export(tmp_path):
+    prefix = str(tmp_path / "tree")
+    export_tree(sample_tree(), prefix)
+    papers_path, edges_path = export_paths(prefix)
+    os.remove(papers_path)
+    os.mkdir(papers_path)
+
+    with pytest.raises(IsADirectoryError):
+        export_tree(sample_tree(), prefix)
+    assert os.path.isdir(papers_path)
+    assert pq.read_table(edges_path).num_rows == 3
+
+
+def test_export_tree_rejects_non_positive_batch_size(tmp_path):
+    with pytest.raises(ValueError):
+        export_tree(sample_tree(), str(tmp_path / "tree"), batch_size=0)